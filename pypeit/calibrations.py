@@ -5,9 +5,12 @@ Class for guiding calibration object generation in PypeIt
 .. include:: ../include/links.rst
 """
 import os
+import threading
 
 from abc import ABCMeta
-from collections import Counter
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from operator import attrgetter
 
 from IPython import embed
 
@@ -58,6 +61,15 @@ class Calibrations:
         show (:obj:`bool`, optional):
             Show plots of PypeIt's results as the code progesses.
             Requires interaction from the users.
+        parallel_build (:obj:`bool`, optional):
+            Run calibration steps in parallel threads as soon as the
+            steps they depend on are complete; see
+            :attr:`step_dependencies`.  If None, this is set by the
+            ``parallel_build`` parameter in ``par``.  Ignored if
+            ``show`` is True.  The threads share the spectrograph
+            object and the logger, so this should only be used for
+            spectrographs that do not alter their own state while
+            the calibrations are built.
 
     .. todo: Fix these
 
@@ -89,6 +101,9 @@ class Calibrations:
             :attr:`fitstbl`.
         calib_ID (:obj:`int`):
             calib group ID of the current frame
+        frame_calib_IDs (`numpy.ndarray`_):
+            calib group ID of each frame in :attr:`fitstbl`; -1 for
+            frames that are not assigned to a single group.
         slitspat_num (:obj:`str` or :obj:`list, optional):
             Identifies a slit or slits to restrict the analysis on
             Used in :func:`get_slits` and propagated beyond
@@ -96,9 +111,35 @@ class Calibrations:
     """
     __metaclass__ = ABCMeta
 
+    _bpm_cache_size = 32
+    """
+    Maximum number of bad-pixel masks kept by each instance; see
+    :func:`get_bpm`.
+    """
+
+    _config_attrs = ('det', 'calib_ID', 'par')
+    """
+    Attributes set by :func:`set_config` that are required by most of
+    the calibration steps; see :func:`_chk_set`.
+    """
+
+    _chk_getters = {}
+    """
+    Attribute getters used by :func:`_chk_objs`, keyed by the tuple of
+    attribute names.
+    """
+
+    step_dependencies = {}
+    """
+    The steps that must be complete before each calibration step can
+    be run; see :func:`run_the_steps`.  Steps not included here depend
+    on all the steps before them in :attr:`steps`.
+    """
+
     @classmethod
     def get_instance(cls, fitstbl, par, spectrograph, caldir, qadir=None,
-                     reuse_masters=False, show=False, slitspat_num=None):
+                     reuse_masters=False, show=False, slitspat_num=None,
+                     parallel_build=None):
         """
         """
         pypeline = spectrograph.pypeline
@@ -107,10 +148,11 @@ class Calibrations:
         return next(c for c in cls.__subclasses__()
                     if c.__name__ == (pypeline + 'Calibrations'))(
             fitstbl, par, spectrograph, caldir, qadir=qadir,
-                     reuse_masters=reuse_masters, show=show, slitspat_num=slitspat_num)
+                     reuse_masters=reuse_masters, show=show, slitspat_num=slitspat_num,
+                     parallel_build=parallel_build)
 
     def __init__(self, fitstbl, par, spectrograph, caldir, qadir=None,
-                 reuse_masters=False, show=False, slitspat_num=None):
+                 reuse_masters=False, show=False, slitspat_num=None, parallel_build=None):
 
         # Check the types
         # TODO -- Remove this None option once we have data models for all the Calibrations
@@ -127,6 +169,14 @@ class Calibrations:
         self.par = par
         self.spectrograph = spectrograph
 
+        # Parse the calibration group of each frame once.  Frames that
+        # are not assigned to a single calibration group (e.g., 'all',
+        # 'None', or '0,1') are given a value of -1; see set_config.
+        self.frame_calib_IDs = None
+        if self.fitstbl is not None and 'calib' in self.fitstbl.keys():
+            self.frame_calib_IDs = np.array([int(c) if str(c).isdigit() else -1
+                                             for c in self.fitstbl['calib']], dtype=int)
+
         # Masters
         self.reuse_masters = reuse_masters
         self.master_dir = caldir
@@ -139,13 +189,19 @@ class Calibrations:
         self.write_qa = qadir is not None
         self.show = show
 
+        # Build independent steps in parallel?  Interactive plotting
+        # must stay in the main thread.
+        if parallel_build is None:
+            parallel_build = self.par['parallel_build']
+        self.parallel_build = parallel_build and not show
+
         # Check the directories exist
         # TODO: This should be done when the masters are saved
-        if caldir is not None and not os.path.isdir(self.master_dir):
-            os.makedirs(self.master_dir)
+        if caldir is not None:
+            os.makedirs(self.master_dir, exist_ok=True)
         # TODO: This should be done when the qa plots are saved
-        if self.write_qa and not os.path.isdir(os.path.join(self.qa_path, 'PNGs')):
-            os.makedirs(os.path.join(self.qa_path, 'PNGs'))
+        if self.write_qa:
+            os.makedirs(os.path.join(self.qa_path, 'PNGs'), exist_ok=True)
 
         # Attributes
         self.det = None
@@ -168,12 +224,102 @@ class Calibrations:
         self.flatimages = None
         self.calib_ID = None
         self.master_key_dict = {}
+        # Rows in fitstbl for each (frame type, calib_ID); see _find_frames
+        self._frame_index_cache = {}
+        # Master keys for each (row, det); see _master_key
+        self._master_key_cache = {}
+        # Full path to every frame in fitstbl; see _frame_paths
+        self._all_frame_paths = None
+        # Bad-pixel masks already generated by this object, with the
+        # least recently used dropped first; see _bpm_cache_key
+        self._bpm_cache = OrderedDict()
+        # Guards the caches above, and the success flags below, when
+        # steps are run in parallel
+        self._cache_lock = threading.Lock()
+        # Tracks whether the step running in each thread failed; see
+        # _run_step
+        self._step_state = threading.local()
 
         # Steps
         self.steps = []
         self.success = False
         self.failed_step = None
 
+    def _find_frames(self, ftype, calib_ID):
+        """
+        Find the rows in :attr:`fitstbl` with the provided frame type
+        and calibration group.
+
+        This is a cached wrapper for
+        :func:`pypeit.metadata.PypeItMetaData.find_frames`.
+
+        Args:
+            ftype (:obj:`str`):
+                Frame type, e.g. 'flat', 'arc', 'bias'
+            calib_ID (:obj:`int`):
+                Calibration group
+
+        Returns:
+            `numpy.ndarray`_: The 0-indexed rows with the requested
+            frames.
+        """
+        key = (ftype, calib_ID)
+        with self._cache_lock:
+            rows = self._frame_index_cache.get(key)
+            if rows is None:
+                rows = self.fitstbl.find_frames(ftype, calib_ID=calib_ID, index=True)
+                self._frame_index_cache[key] = rows
+        return rows
+
+    def _master_key(self, row, det):
+        """
+        Construct the master key for the provided row in :attr:`fitstbl`.
+
+        This is a cached wrapper for
+        :func:`pypeit.metadata.PypeItMetaData.master_key`.
+
+        Args:
+            row (:obj:`int`):
+                The 0-indexed row used to construct the key.
+            det (:obj:`int`):
+                The 1-indexed detector.
+
+        Returns:
+            :obj:`str`: Master key
+        """
+        key = (int(row), det)
+        with self._cache_lock:
+            master_key = self._master_key_cache.get(key)
+            if master_key is None:
+                master_key = self.fitstbl.master_key(row, det=det)
+                self._master_key_cache[key] = master_key
+        return master_key
+
+    def _frame_paths(self, rows):
+        """
+        Return the full paths to one or more frames in :attr:`fitstbl`.
+
+        The paths to all frames are constructed once, using
+        :func:`pypeit.metadata.PypeItMetaData.frame_paths`, and then
+        indexed for all subsequent calls.
+
+        Args:
+            rows (:obj:`int`, array-like):
+                One or more 0-indexed rows in :attr:`fitstbl`.
+
+        Returns:
+            :obj:`str`, :obj:`list`: The full path to the frame if
+            ``rows`` is a single integer; otherwise, the list of full
+            paths.
+        """
+        with self._cache_lock:
+            if self._all_frame_paths is None:
+                self._all_frame_paths = np.array(
+                        self.fitstbl.frame_paths(np.arange(len(self.fitstbl))), dtype=object)
+        if isinstance(rows, (int, np.integer)):
+            return self._all_frame_paths[rows]
+        return self._all_frame_paths[rows].tolist()
+
     def _prep_calibrations(self, ctype):
         """
         Parse self.fitstbl for rows matching the calibration type
@@ -190,10 +336,10 @@ class Calibrations:
 
         """
         # Grab rows and files
-        rows = self.fitstbl.find_frames(ctype, calib_ID=self.calib_ID, index=True)
-        image_files = self.fitstbl.frame_paths(rows)
+        rows = self._find_frames(ctype, self.calib_ID)
+        image_files = self._frame_paths(rows)
         # Return
-        return image_files, self.fitstbl.master_key(rows[0] if len(rows) > 0 else self.frame, det=self.det)
+        return image_files, self._master_key(rows[0] if len(rows) > 0 else self.frame, self.det)
 
     def set_config(self, frame, det, par=None):
         """
@@ -212,7 +358,10 @@ class Calibrations:
 
         # Initialize for this setup
         self.frame = frame
-        self.calib_ID = int(self.fitstbl['calib'][frame])
+        self.calib_ID = int(self.frame_calib_IDs[frame])
+        if self.calib_ID < 0:
+            msgs.error('Frame {0} must be assigned to a single calibration group; '
+                       'calib = {1}'.format(frame, self.fitstbl['calib'][frame]))
         self.det = det
         if par is not None:
             self.par = par
@@ -220,7 +369,7 @@ class Calibrations:
         self.binning = self.fitstbl['binning'][self.frame]
 
         # Initialize the master key dict for this science/standard frame
-        self.master_key_dict['frame'] = self.fitstbl.master_key(frame, det=det)
+        self.master_key_dict['frame'] = self._master_key(frame, det)
         # Initialize the master dict for input, output
 
     def get_arc(self):
@@ -237,7 +386,7 @@ class Calibrations:
 
         """
         # Check internals
-        self._chk_set(['det', 'calib_ID', 'par'])
+        self._chk_set(self._config_attrs)
 
         # Prep
         arc_files, self.master_key_dict['arc'] = self._prep_calibrations('arc')
@@ -245,7 +394,7 @@ class Calibrations:
             buildimage.ArcImage, self.master_key_dict['arc'], master_dir=self.master_dir)
 
         # Reuse master frame?
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self.reuse_masters and os.path.isfile(masterframe_name):
             self.msarc = buildimage.ArcImage.from_file(masterframe_name)
         elif len(arc_files) == 0:
             msgs.warn("No frametype=arc files to build arc")
@@ -275,7 +424,7 @@ class Calibrations:
 
         """
         # Check internals
-        self._chk_set(['det', 'calib_ID', 'par'])
+        self._chk_set(self._config_attrs)
 
         # Prep
         tilt_files, self.master_key_dict['tilt'] = self._prep_calibrations('tilt')
@@ -283,7 +432,7 @@ class Calibrations:
             buildimage.TiltImage, self.master_key_dict['tilt'], master_dir=self.master_dir)
 
         # Reuse master frame?
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self.reuse_masters and os.path.isfile(masterframe_name):
             self.mstilt = buildimage.TiltImage.from_file(masterframe_name)
         elif len(tilt_files) == 0:
             msgs.warn("No frametype=tilt files to build tiltimg")
@@ -315,11 +464,11 @@ class Calibrations:
 
         """
         # Check for existing data
-        if not self._chk_objs(['msbpm', 'slits']):
+        if not self._chk_objs(('msbpm', 'slits')):
             msgs.error('Must have the bpm and slits to make the alignments!')
 
         # Check internals
-        self._chk_set(['det', 'calib_ID', 'par'])
+        self._chk_set(self._config_attrs)
 
         # Prep
         align_files, self.master_key_dict['align'] = self._prep_calibrations('align')
@@ -329,7 +478,7 @@ class Calibrations:
                                                                master_dir=self.master_dir)
 
         # Reuse master frame?
-        if os.path.isfile(masterframe_filename) and self.reuse_masters:
+        if self.reuse_masters and os.path.isfile(masterframe_filename):
             self.alignments = alignframe.Alignments.from_file(masterframe_filename)
             self.alignments.is_synced(self.slits)
             return self.alignments
@@ -337,8 +486,9 @@ class Calibrations:
         msalign = buildimage.buildimage_fromlist(self.spectrograph, self.det, self.par['alignframe'], align_files,
                                                  bias=self.msbias, bpm=self.msbpm)
 
-        # Extract some header info needed by the algorithm
-        binning = self.spectrograph.get_meta_value(align_files[0], 'binning')
+        # The detector binning was already read when the image was built;
+        # don't re-open the raw file to get it.
+        binning = msalign.detector.binning
 
         # Instantiate
         alignment = alignframe.TraceAlignment(msalign, self.slits, self.spectrograph, self.par['alignment'],
@@ -363,7 +513,7 @@ class Calibrations:
         """
 
         # Check internals
-        self._chk_set(['det', 'calib_ID', 'par'])
+        self._chk_set(self._config_attrs)
 
         # Prep
         bias_files, self.master_key_dict['bias'] = self._prep_calibrations('bias')
@@ -376,7 +526,7 @@ class Calibrations:
             msgs.error("Not ready to load from disk")
 
         # Try to load?
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self.reuse_masters and os.path.isfile(masterframe_name):
             self.msbias = buildimage.BiasImage.from_file(masterframe_name)
         elif len(bias_files) == 0:
             self.msbias = None
@@ -403,7 +553,7 @@ class Calibrations:
         """
 
         # Check internals
-        self._chk_set(['det', 'calib_ID', 'par'])
+        self._chk_set(self._config_attrs)
 
         # Prep
         dark_files, self.master_key_dict['dark'] = self._prep_calibrations('dark')
@@ -413,7 +563,7 @@ class Calibrations:
                                                            master_dir=self.master_dir)
 
         # Try to load?
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self.reuse_masters and os.path.isfile(masterframe_name):
             self.msdark = buildimage.DarkImage.from_file(masterframe_name)
         elif len(dark_files) == 0:
             self.msdark = None
@@ -447,25 +597,72 @@ class Calibrations:
 
         """
         # Check internals
-        self._chk_set(['par', 'det'])
+        self._chk_set(('par', 'det'))
 
         # Generate a bad pixel mask (should not repeat)
-        self.master_key_dict['bpm'] = self.fitstbl.master_key(self.frame, det=self.det)
+        self.master_key_dict['bpm'] = self._master_key(self.frame, self.det)
 
         # Build the data-section image
-        sci_image_file = self.fitstbl.frame_paths(self.frame)
+        sci_image_file = self._frame_paths(self.frame)
 
         # Check if a bias frame exists, and if a BPM should be generated
         msbias = None
         if self.par['bpm_usebias']:
             msbias = self.msbias
-        # Build it
-        self.msbpm = self.spectrograph.bpm(sci_image_file, self.det, msbias=msbias)
+        # Reuse a previously generated BPM?
+        cache_key = self._bpm_cache_key(sci_image_file, msbias)
+        if cache_key in self._bpm_cache:
+            # Copy so that the cached BPM cannot be altered downstream
+            self.msbpm = self._bpm_cache[cache_key].copy()
+            self._bpm_cache.move_to_end(cache_key)
+        else:
+            # Build it
+            self.msbpm = self.spectrograph.bpm(sci_image_file, self.det, msbias=msbias)
+            # Only cache it if the bias (if used) can be identified
+            if cache_key is not None:
+                self._bpm_cache[cache_key] = self.msbpm.copy()
+                if len(self._bpm_cache) > self._bpm_cache_size:
+                    self._bpm_cache.popitem(last=False)
         self.shape = self.msbpm.shape
 
         # Return
         return self.msbpm
 
+    def _bpm_cache_key(self, sci_image_file, msbias):
+        """
+        Construct the key used to store the bad-pixel mask in
+        :attr:`_bpm_cache`.
+
+        The mask can depend on any header value of the raw science
+        frame, so the key is built from the path to and modification
+        time of that frame, the detector, and the path to and
+        modification time of the master bias file used to build the
+        mask, if any.
+
+        Args:
+            sci_image_file (:obj:`str`):
+                Raw science frame used to build the mask.
+            msbias (:class:`~pypeit.images.buildimage.BiasImage`):
+                Bias used to build the mask.  Can be None.
+
+        Returns:
+            :obj:`tuple`: The cache key, or None if the science frame or
+            the master bias file cannot be found.
+        """
+        bias_file = None
+        bias_mtime = None
+        if msbias is not None:
+            bias_file = masterframe.construct_file_name(buildimage.BiasImage,
+                                                        self.master_key_dict['bias'],
+                                                        master_dir=self.master_dir)
+            if not os.path.isfile(bias_file):
+                return None
+            bias_mtime = os.path.getmtime(bias_file)
+        if not os.path.isfile(sci_image_file):
+            return None
+        return (sci_image_file, os.path.getmtime(sci_image_file), self.det, bias_file,
+                bias_mtime)
+
     def get_flats(self):
         """
         Load or generate a normalized pixel flat and slit illumination
@@ -477,14 +674,20 @@ class Calibrations:
         Constructs :attr:`flatimages`.
 
         """
+        # Skip flat-fielding altogether?
+        if self.par['flatfield']['method'] == 'skip':
+            msgs.info('Flat-field method set to skip; no flats will be loaded or generated.')
+            self.flatimages = flatfield.FlatImages()
+            return self.flatimages
+
         # Check for existing data
-        if not self._chk_objs(['msarc', 'msbpm', 'slits', 'wv_calib']):
+        if not self._chk_objs(('msarc', 'msbpm', 'slits', 'wv_calib')):
             msgs.warn('Must have the arc, bpm, slits, and wv_calib defined to make flats!  Skipping and may crash down the line')
             self.flatimages = flatfield.FlatImages()
             return
 
         # Slit and tilt traces are required to flat-field the data
-        if not self._chk_objs(['slits', 'wavetilts']):
+        if not self._chk_objs(('slits', 'wavetilts')):
             # TODO: Why doesn't this fault?
             msgs.warn('Flats were requested, but there are quantities missing necessary to '
                       'create flats.  Proceeding without flat fielding....')
@@ -492,7 +695,7 @@ class Calibrations:
             return
 
         # Check internals
-        self._chk_set(['det', 'calib_ID', 'par'])
+        self._chk_set(self._config_attrs)
 
         # Prep
         illum_image_files, self.master_key_dict['flat'] = self._prep_calibrations('illumflat')
@@ -509,16 +712,12 @@ class Calibrations:
         #   3.  Load any user-supplied images to over-ride any built
 
         # Load MasterFrame?
-        if os.path.isfile(masterframe_filename) and self.reuse_masters:
+        if self.reuse_masters and os.path.isfile(masterframe_filename):
             flatimages = flatfield.FlatImages.from_file(masterframe_filename)
             flatimages.is_synced(self.slits)
             # Load user defined files
             if self.par['flatfield']['pixelflat_file'] is not None:
-                # Load
-                msgs.info('Using user-defined file: {0}'.format('pixelflat_file'))
-                with io.fits_open(self.par['flatfield']['pixelflat_file']) as hdu:
-                    nrm_image = flatfield.FlatImages(pixelflat_norm=hdu[self.det].data)
-                    flatimages = flatfield.merge(flatimages, nrm_image)
+                flatimages = flatfield.merge(flatimages, self._user_pixelflat())
             self.flatimages = flatimages
             # update slits
             self.slits.mask_flats(self.flatimages)
@@ -574,15 +773,35 @@ class Calibrations:
         #  NOTE:  This is the *final* images, not just a stack
         #  And it will over-ride what is generated below (if generated)
         if self.par['flatfield']['pixelflat_file'] is not None:
-            # Load
-            msgs.info('Using user-defined file: {0}'.format('pixelflat_file'))
-            with io.fits_open(self.par['flatfield']['pixelflat_file']) as hdu:
-                flatimages = flatfield.merge(flatimages, flatfield.FlatImages(pixelflat_norm=hdu[self.det].data))
+            flatimages = flatfield.merge(flatimages, self._user_pixelflat())
 
         self.flatimages = flatimages
         # Return
         return self.flatimages
 
+    def _user_pixelflat(self):
+        """
+        Load the user-defined pixel flat.
+
+        The file set by the ``pixelflat_file`` parameter is used as
+        given if it exists; otherwise, it is searched for in
+        :attr:`master_dir`.  Each candidate path is checked at most
+        once.
+
+        Returns:
+            :class:`pypeit.flatfield.FlatImages`: Object with only the
+            normalized pixel flat defined.
+        """
+        pixelflat_file = self.par['flatfield']['pixelflat_file']
+        candidates = [pixelflat_file]
+        if self.master_dir is not None:
+            candidates += [os.path.join(self.master_dir, pixelflat_file)]
+        _pixelflat_file = next((c for c in candidates if os.path.isfile(c)), None)
+        if _pixelflat_file is None:
+            msgs.error('Could not find user-defined pixel flat: {0}'.format(pixelflat_file))
+        msgs.info('Using user-defined file: {0}'.format(_pixelflat_file))
+        return flatfield.FlatImages(pixelflat_norm=io.fits_read_image(_pixelflat_file, self.det))
+
     def get_slits(self):
         """
         Load or generate the definition of the slit boundaries.
@@ -596,11 +815,11 @@ class Calibrations:
 
         """
         # Check for existing data
-        if not self._chk_objs(['msbpm']):
+        if not self._chk_objs('msbpm'):
             return
 
         # Check internals
-        self._chk_set(['det', 'calib_ID', 'par'])
+        self._chk_set(self._config_attrs)
 
         # Prep
         trace_image_files, self.master_key_dict['trace'] = self._prep_calibrations('trace')
@@ -609,7 +828,7 @@ class Calibrations:
         slit_masterframe_name = masterframe.construct_file_name(slittrace.SlitTraceSet,
                                                            self.master_key_dict['trace'],
                                                            master_dir=self.master_dir)
-        if os.path.isfile(slit_masterframe_name) and self.reuse_masters:
+        if self.reuse_masters and os.path.isfile(slit_masterframe_name):
             self.slits = slittrace.SlitTraceSet.from_file(slit_masterframe_name)
             # Reset the bitmask
             self.slits.mask = self.slits.mask_init.copy()
@@ -619,7 +838,7 @@ class Calibrations:
                                                                self.master_key_dict['trace'],
                                                                master_dir=self.master_dir)
             # Reuse master frame?
-            if os.path.isfile(edge_masterframe_name) and self.reuse_masters:
+            if self.reuse_masters and os.path.isfile(edge_masterframe_name):
                 self.edges = edgetrace.EdgeTraceSet.from_file(edge_masterframe_name)
             elif len(trace_image_files) == 0:
                 msgs.warn("No frametype=trace files to build slits")
@@ -634,7 +853,7 @@ class Calibrations:
                                                     self.par['slitedges'], bpm=self.msbpm,
                                                     auto=True)
                 if not self.edges.success:
-                    self.success = False
+                    self._fail_step()
                     return None
                 self.edges.to_master_file(edge_masterframe_name)
 
@@ -665,13 +884,13 @@ class Calibrations:
             dict: :attr:`wv_calib` calibration dict and the updated slit mask array
         """
         # Check for existing data
-        if not self._chk_objs(['msarc', 'msbpm', 'slits']):
+        if not self._chk_objs(('msarc', 'msbpm', 'slits')):
             msgs.warn('Not enough information to load/generate the wavelength calibration. Skipping and may crash down the line')
             return None
 
         # Check internals
-        self._chk_set(['det', 'calib_ID', 'par'])
-        if 'arc' not in self.master_key_dict.keys():
+        self._chk_set(self._config_attrs)
+        if 'arc' not in self.master_key_dict:
             msgs.error('Arc master key not set.  First run get_arc.')
 
         # No wavelength calibration requested
@@ -680,18 +899,17 @@ class Calibrations:
             self.wv_calib = None
             return self.wv_calib
 
-        # Grab arc binning (may be different from science!)
-        # TODO : Do this internally when we have a wv_calib DataContainer
-        binspec, binspat = parse.parse_binning(self.msarc.detector.binning)
-
         masterframe_name = masterframe.construct_file_name(wavecalib.WaveCalib,
                                                            self.master_key_dict['arc'],
                                                            master_dir=self.master_dir)
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self.reuse_masters and os.path.isfile(masterframe_name):
             self.wv_calib = wavecalib.WaveCalib.from_file(masterframe_name)
             self.wv_calib.chk_synced(self.slits)
             self.slits.mask_wvcalib(self.wv_calib)
         else:
+            # Grab arc binning (may be different from science!)
+            # TODO : Do this internally when we have a wv_calib DataContainer
+            binspec, binspat = parse.parse_binning(self.msarc.detector.binning)
             # Instantiate
             self.waveCalib = wavecalib.BuildWaveCalib(self.msarc, self.slits, self.spectrograph,
                                              self.par['wavelengths'], binspectral=binspec,
@@ -719,19 +937,19 @@ class Calibrations:
         """
         # Check for existing data
         #TODO add mstilt_inmask to this list when it gets implemented.
-        if not self._chk_objs(['mstilt', 'msbpm', 'slits', 'wv_calib']):
+        if not self._chk_objs(('mstilt', 'msbpm', 'slits', 'wv_calib')):
             msgs.warn('dont have all the objects for tilts.  Skipping and may crash down the line..')
             return None
 
         # Check internals
-        self._chk_set(['det', 'calib_ID', 'par'])
-        if 'tilt' not in self.master_key_dict.keys():
+        self._chk_set(self._config_attrs)
+        if 'tilt' not in self.master_key_dict:
             msgs.error('Tilt master key not set.  First run get_tiltimage.')
 
         # Load up?
         masterframe_name = masterframe.construct_file_name(wavetilts.WaveTilts, self.master_key_dict['tilt'],
                                                            master_dir=self.master_dir)
-        if os.path.isfile(masterframe_name) and self.reuse_masters:
+        if self.reuse_masters and os.path.isfile(masterframe_name):
             self.wavetilts = wavetilts.WaveTilts.from_file(masterframe_name)
             self.wavetilts.is_synced(self.slits)
             self.slits.mask_wavetilts(self.wavetilts)
@@ -755,22 +973,119 @@ class Calibrations:
     def run_the_steps(self):
         """
         Run full the full recipe of calibration steps.
+
+        If :attr:`parallel_build` is True, each step is run in a
+        separate thread as soon as all the steps it depends on are
+        complete; see :func:`_step_prerequisites`.  Most of the time in
+        each step is spent reading files and in numpy, both of which
+        release the GIL.
         """
         self.success = True
-        for step in self.steps:
-            getattr(self, f'get_{step}')()
-            if not self.success:
-                self.failed_step = f'get_{step}'
-                return
+        # Look up the method for each step once; this also faults on an
+        # unknown step before any calibrations are done
+        step_methods = {step: getattr(self, f'get_{step}') for step in self.steps}
+        if self.parallel_build:
+            self._run_the_steps_in_parallel(step_methods)
+        else:
+            for step in self.steps:
+                self._run_step(step, step_methods[step])
+                if not self.success:
+                    break
+        if not self.success:
+            return
         msgs.info("Calibration complete!")
         msgs.info("#######################################################################")
 
+    def _run_the_steps_in_parallel(self, step_methods):
+        """
+        Run the calibration steps in threads, submitting each step
+        once its prerequisites are complete.
+
+        No new steps are started after a step fails; the steps already
+        running are allowed to finish.
+
+        Args:
+            step_methods (:obj:`dict`):
+                The method to call for each step in :attr:`steps`.
+        """
+        prereqs = self._step_prerequisites()
+        pending = list(self.steps)
+        done = set()
+        running = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            while running or (pending and self.success):
+                if self.success:
+                    for step in [s for s in pending if prereqs[s] <= done]:
+                        pending.remove(step)
+                        running[executor.submit(self._run_step, step, step_methods[step])] = step
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    # Re-raise any exception from the worker thread
+                    future.result()
+                    done.add(step)
+
+    def _run_step(self, step, method):
+        """
+        Run a single calibration step.
+
+        If the step flags itself as failed (see :func:`_fail_step`),
+        :attr:`failed_step` is set to this step, unless a different
+        step already failed.  This is safe when the steps are run in
+        parallel because each step only reports its own failure.
+
+        Args:
+            step (:obj:`str`):
+                Name of the step in :attr:`steps`.
+            method (callable):
+                The method that runs the step.
+        """
+        self._step_state.failed = False
+        method()
+        if self._step_state.failed:
+            with self._cache_lock:
+                if self.failed_step is None:
+                    self.failed_step = f'get_{step}'
+
+    def _fail_step(self):
+        """
+        Flag that the calibration step running in the current thread
+        failed.
+
+        This sets :attr:`success` to False; :func:`_run_step` then
+        records the step in :attr:`failed_step`.
+        """
+        self._step_state.failed = True
+        with self._cache_lock:
+            self.success = False
+
+    def _step_prerequisites(self):
+        """
+        Construct the set of steps that must be complete before each
+        step in :attr:`steps` is run.
+
+        Prerequisites are taken from :attr:`step_dependencies`, limited
+        to the steps that precede each step in :attr:`steps`; this
+        guarantees the steps can always be completed.  Steps without
+        an entry in :attr:`step_dependencies` require all preceding
+        steps.
+
+        Returns:
+            :obj:`dict`: The set of prerequisite steps keyed by each step.
+        """
+        prereqs = {}
+        for i, step in enumerate(self.steps):
+            preceding = set(self.steps[:i])
+            prereqs[step] = preceding if step not in self.step_dependencies \
+                                else preceding & set(self.step_dependencies[step])
+        return prereqs
+
     def _chk_set(self, items):
         """
         Check whether a needed attribute has previously been set
 
         Args:
-            items (list): Attributes to check
+            items (:obj:`tuple`): Attributes to check
 
         """
         for item in items:
@@ -783,21 +1098,49 @@ class Calibrations:
         Check that the input items exist internally as attributes
 
         Args:
-            items (list):
+            items (:obj:`str`, :obj:`tuple`):
+                Attribute or attributes to check
 
         Returns:
             bool: True if all exist
 
         """
+        if isinstance(items, str):
+            # Single attribute; avoid building a 1-tuple
+            return self._chk_obj(items)
+        getter = self._chk_getters.get(items)
+        if getter is None:
+            getter = attrgetter(*items)
+            self._chk_getters[items] = getter
+        values = getter(self)
+        if all(v is not None for v in (values if len(items) > 1 else (values,))):
+            return True
+        # Find and report the missing attribute
         for obj in items:
-            if getattr(self, obj) is None:
-                msgs.warn("You need to generate {:s} prior to this calibration..".format(obj))
-                # Strip ms
-                iobj = obj[2:] if obj[0:2] == 'ms' else obj
-                msgs.warn("Use get_{:s}".format(iobj))
+            if not self._chk_obj(obj):
                 return False
         return True
 
+    def _chk_obj(self, obj):
+        """
+        Check that a single item exists internally as an attribute
+
+        Args:
+            obj (:obj:`str`):
+                Attribute to check
+
+        Returns:
+            bool: True if it exists
+
+        """
+        if getattr(self, obj) is None:
+            msgs.warn("You need to generate {:s} prior to this calibration..".format(obj))
+            # Strip ms
+            iobj = obj[2:] if obj[0:2] == 'ms' else obj
+            msgs.warn("Use get_{:s}".format(iobj))
+            return False
+        return True
+
     def __repr__(self):
         # Generate sets string
         txt = '<{:s}: frame={}, det={}, calib_ID={}'.format(self.__class__.__name__,
@@ -819,6 +1162,19 @@ class MultiSlitCalibrations(Calibrations):
 
     ..todo:: Rename this child or eliminate altogether
     """
+    # The tilt image uses the slits for the flexure correction, and
+    # wv_calib, tilts, and flats all update the slit mask; these are
+    # kept in order.
+    step_dependencies = {'bias': [],
+                         'dark': [],
+                         'bpm': ['bias'],
+                         'slits': ['bias', 'dark', 'bpm'],
+                         'arc': ['bias', 'bpm'],
+                         'tiltimg': ['bias', 'bpm', 'slits'],
+                         'wv_calib': ['bpm', 'slits', 'arc', 'tiltimg'],
+                         'tilts': ['bpm', 'slits', 'tiltimg', 'wv_calib'],
+                         'flats': ['bias', 'dark', 'bpm', 'slits', 'arc', 'wv_calib', 'tilts']}
+
     def __init__(self, fitstbl, par, spectrograph, caldir, **kwargs):
         super(MultiSlitCalibrations, self).__init__(fitstbl, par, spectrograph, caldir, **kwargs)
         self.steps = MultiSlitCalibrations.default_steps()
@@ -842,6 +1198,21 @@ class IFUCalibrations(Calibrations):
     See :class:`pypeit.calibrations.Calibrations` for arguments.
 
     """
+    # The tilt image is built before the slits are defined, and
+    # wv_calib, tilts, align, and flats all use or update the slits;
+    # these are kept in order.
+    step_dependencies = {'bias': [],
+                         'dark': [],
+                         'bpm': ['bias'],
+                         'arc': ['bias', 'bpm'],
+                         'tiltimg': ['bias', 'bpm'],
+                         'slits': ['bias', 'dark', 'bpm', 'tiltimg'],
+                         'wv_calib': ['bpm', 'slits', 'arc'],
+                         'tilts': ['bpm', 'slits', 'tiltimg', 'wv_calib'],
+                         'align': ['bias', 'bpm', 'slits', 'tilts'],
+                         'flats': ['bias', 'dark', 'bpm', 'slits', 'arc', 'wv_calib', 'tilts',
+                                   'align']}
+
 
     def __init__(self, fitstbl, par, spectrograph, caldir, **kwargs):
         super(IFUCalibrations, self).__init__(fitstbl, par, spectrograph, caldir, **kwargs)
@@ -886,6 +1257,15 @@ def check_for_calibs(par, fitstbl, raise_error=True, cut_cfg=None):
     is_science = fitstbl.find_frames('science')
     # Frame indices
     frame_indx = np.arange(len(fitstbl))
+    # Number of frames of each type in each calibration group; the
+    # same group is checked for every science frame that uses it
+    nframes = {}
+
+    def _nframes(ftype, calib_ID):
+        key = (ftype, calib_ID)
+        if key not in nframes:
+            nframes[key] = len(fitstbl.find_frames(ftype, calib_ID=calib_ID, index=True))
+        return nframes[key]
 
     for i in range(fitstbl.n_calib_groups):
         in_grp = fitstbl.find_calib_group(i)
@@ -896,8 +1276,7 @@ def check_for_calibs(par, fitstbl, raise_error=True, cut_cfg=None):
             calib_ID = int(fitstbl['calib'][frames[0]])
             # Arc, tilt, science
             for ftype in ['arc', 'tilt', 'science', 'trace']:
-                rows = fitstbl.find_frames(ftype, calib_ID=calib_ID, index=True)
-                if len(rows) == 0:
+                if _nframes(ftype, calib_ID) == 0:
                     # Fail
                     msg = "No frames of type={} provided. Add them to your PypeIt file if this is a standard run!".format(ftype)
                     pass_calib = False
@@ -910,8 +1289,7 @@ def check_for_calibs(par, fitstbl, raise_error=True, cut_cfg=None):
             for key, ftype in zip(['use_biasimage', 'use_darkimage', 'use_pixelflat', 'use_illumflat'],
                                   ['bias', 'dark', 'pixelflat', 'illumflat']):
                 if par['scienceframe']['process'][key]:
-                    rows = fitstbl.find_frames(ftype, calib_ID=calib_ID, index=True)
-                    if len(rows) == 0:
+                    if _nframes(ftype, calib_ID) == 0:
                         # Allow for pixelflat inserted
                         if ftype == 'pixelflat' and par['calibrations']['flatfield']['pixelflat_file'] is not None:
                             continue
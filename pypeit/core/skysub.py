@@ -110,26 +110,38 @@ def global_skysub(image, ivar, tilts, thismask, slit_left, slit_righ, inmask=Non
 
     # Init
     (nspec, nspat) = image.shape
-    piximg = tilts * (nspec-1)
     if inmask is None:
-        inmask = (ivar > 0.0) & thismask & np.isfinite(image) & np.isfinite(ivar)
+        # Combine the masks in place to limit the number of temporary
+        # arrays
+        inmask = ivar > 0.0
+        inmask &= thismask
+        inmask &= np.isfinite(image)
+        inmask &= np.isfinite(ivar)
     elif inmask.dtype != np.bool:
         # Check that it's of type bool
         msgs.error("Type of inmask should be bool and is of type: {:}".format(inmask.dtype))
 
     # Sky pixels for fitting
-    gpm = thismask & (ivar > 0.0) & inmask & np.logical_not(edgmask)
+    gpm = ivar > 0.0
+    gpm &= thismask
+    gpm &= inmask
+    gpm &= np.logical_not(edgmask)
     if not np.any(gpm):
         msgs.warn("Input pixel mask + edges has no good pixels.  There is likely a problem with this slit.")
         return np.zeros(np.sum(thismask))
 
-    # Sub arrays
-    isrt = np.argsort(piximg[thismask])
-    pix = piximg[thismask][isrt]
-    sky = image[thismask][isrt]
-    sky_ivar = ivar[thismask][isrt]
-    ximg_fit = ximg[thismask][isrt]
-    inmask_fit = gpm[thismask][isrt]
+    # Sub arrays.  Find the flattened indices of the pixels in the slit,
+    # sorted by their spectral pixel position, and then pull the sorted
+    # values directly from the flattened images.
+    indx = np.flatnonzero(thismask)
+    pix = tilts.ravel()[indx] * (nspec-1)
+    isrt = np.argsort(pix)
+    pix = pix[isrt]
+    indx = indx[isrt]
+    sky = image.ravel()[indx]
+    sky_ivar = ivar.ravel()[indx]
+    ximg_fit = ximg.ravel()[indx]
+    inmask_fit = gpm.ravel()[indx]
     inmask_prop = inmask_fit.copy()
     #spatial = spatial_img[fit_sky][isrt]
 
@@ -182,10 +194,8 @@ def global_skysub(image, ivar, tilts, thismask, slit_left, slit_righ, inmask=Non
                                         kwargs_bspline={'bkspace': bsp},
                                         kwargs_reject={'groupbadpix': False, 'maxrej': 10})
 
-    sky_frame = np.zeros_like(image)
     ythis = np.zeros_like(yfit)
     ythis[isrt] = yfit
-    sky_frame[thismask] = ythis
 
 
     #skyset.funcname ='legendre'
@@ -372,14 +382,11 @@ def optimal_bkpts(bkpts_optimal, bsp_min, piximg, sampmask, samp_frac=0.80,
         fullbkpt = fullbkpt_grid
         used_grid = True
     else:
-        piximg_temp = np.ma.array(np.copy(piximg))
-        piximg_temp.mask = np.invert(sampmask)
-        samplmin = np.ma.min(piximg_temp,fill_value=np.inf,axis=1)
-        samplmin = samplmin[np.invert(samplmin.mask)].data
-        samplmax = np.ma.max(piximg_temp,fill_value=-np.inf,axis=1)
-        samplmax = samplmax[np.invert(samplmax.mask)].data
-        if samplmax.size != samplmin.size:
-            msgs.error('This should not happen')
+        # Minimum and maximum sampled pixel in each spectral row with
+        # any sampled pixels
+        has_samp = np.any(sampmask, axis=1)
+        samplmin = np.amin(np.where(sampmask, piximg, np.inf), axis=1)[has_samp]
+        samplmax = np.amax(np.where(sampmask, piximg, -np.inf), axis=1)[has_samp]
         nbkpt = samplmax.size
         # Determine the sampling. dsamp represents the gap in spectral pixel (wavelength) coverage between
         # subsequent spectral direction pixels in the piximg, i.e. it is the difference between the minimum
@@ -476,7 +483,7 @@ def local_skysub_extract(sciimg, sciivar, tilts, waveimg, global_sky, rn2_img,
                          spat_pix=None, adderr=0.01, bsp=0.6, trim_edg=(3,3),
                          std=False, prof_nsigma=None, niter=4, box_rad=7, sigrej=3.5, bkpts_optimal=True,
                          debug_bkpts=False, force_gauss=False, sn_gauss=4.0, model_full_slit=False, model_noise=True, show_profile=False,
-                         show_resids=False, use_2dmodel_mask=True, no_local_sky=False):
+                         show_resids=False, use_2dmodel_mask=True, no_local_sky=False, piximg=None):
     """Perform local sky subtraction and  extraction
 
      Args:
@@ -603,6 +610,11 @@ def local_skysub_extract(sciimg, sciivar, tilts, waveimg, global_sky, rn2_img,
         no_local_sky (bool, optional):
             If True, do not fit local sky model, only object profile and extract optimally
             The objimage will be all zeros.
+        piximg (`numpy.ndarray`_, optional):
+            Image with the spectral pixel sampling, i.e. ``tilts *
+            (nspec-1)``. If None, it is computed from ``tilts``. This
+            allows the image to be computed once when extracting
+            many slits.
 
     Returns:
         :obj:`tuple`:  Returns (skyimage[thismask], objimage[thismask],
@@ -612,10 +624,14 @@ def local_skysub_extract(sciimg, sciivar, tilts, waveimg, global_sky, rn2_img,
 
     # TODO -- This should be using the SlitTraceSet method
     ximg, edgmask = pixels.ximg_and_edgemask(slit_left, slit_righ, thismask, trim_edg=trim_edg)
+    # Pixels away from the slit edges; computed once for all iterations
+    # of the sky model
+    not_edgmask = np.invert(edgmask)
 
     nspat = sciimg.shape[1]
     nspec = sciimg.shape[0]
-    piximg = tilts * (nspec-1)
+    if piximg is None:
+        piximg = tilts * (nspec-1)
 
     # Copy the specobjs that will be the output
     nobj = len(sobjs)
@@ -779,7 +795,7 @@ def local_skysub_extract(sciimg, sciivar, tilts, waveimg, global_sky, rn2_img,
                 sortpix = (piximg.flat[isub]).argsort()
                 obj_profiles_flat = obj_profiles.reshape(nspec * nspat, objwork)
 
-                skymask = outmask & np.invert(edgmask)
+                skymask = outmask & not_edgmask
                 sky_bmodel, obj_bmodel, outmask_opt = skyoptimal(
                         piximg.flat[isub], sciimg.flat[isub], (modelivar * skymask).flat[isub],
                         obj_profiles_flat[isub, :], sortpix, spatial=spatial_img.flat[isub],
@@ -980,6 +996,8 @@ def ech_local_skysub_extract(sciimg, sciivar, fullmask, tilts, waveimg, global_s
     # Set initially to sciivar in case no obects were found.
     ivarmodel = np.copy(sciivar)
     sobjs = sobjs.copy()
+    # Spectral pixel sampling shared by all orders
+    piximg = tilts * (sciimg.shape[0]-1)
 
     norders = order_vec.size
     slit_vec = np.arange(norders)
@@ -1096,7 +1114,7 @@ def ech_local_skysub_extract(sciimg, sciivar, fullmask, tilts, waveimg, global_s
             ingpm=inmask,std = std, bsp=bsp, trim_edg=trim_edg,
             prof_nsigma=prof_nsigma, niter=niter, box_rad=box_rad_order[iord], sigrej=sigrej, bkpts_optimal=bkpts_optimal,
             force_gauss=force_gauss, sn_gauss=sn_gauss, model_full_slit=model_full_slit, model_noise=model_noise,
-            debug_bkpts=debug_bkpts, show_resids=show_resids, show_profile=show_profile)
+            debug_bkpts=debug_bkpts, show_resids=show_resids, show_profile=show_profile, piximg=piximg)
 
         # update the FWHM fitting vector for the brighest object
         indx = (sobjs.ECH_OBJID == uni_objid[ibright]) & (sobjs.ECH_ORDERINDX == iord)
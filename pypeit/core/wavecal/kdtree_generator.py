@@ -282,7 +282,10 @@ def main(polygon, numsearch=8, maxlinear=100.0, use_unknowns=True, leafsize=30,
     print("Generating Tree")
     tree = cKDTree(pattern, leafsize=leafsize)
     print("Saving Tree")
-    pickle.dump(tree, open(outname, 'wb'))
+    # The highest protocol writes the tree's numpy buffers without the
+    # per-element overhead of the default protocol
+    with open(outname, 'wb') as f:
+        pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
     print("Written KD Tree file:\n{0:s}".format(outname))
     np.save(outindx, index)
     print("Written index file:\n{0:s}".format(outindx))
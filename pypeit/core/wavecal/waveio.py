@@ -349,7 +349,8 @@ def load_tree(polygon=4, numsearch=20):
     fileindx = pypeit.__path__[0] +\
                '/data/arc_lines/lists/ThAr_patterns_poly{0:d}_search{1:d}.index.npy'.format(polygon, numsearch)
     try:
-        file_load = pickle.load(open(filename, 'rb'))
+        with open(filename, 'rb') as f:
+            file_load = pickle.load(f)
         index = np.load(fileindx)
     except FileNotFoundError:
         msgs.info('The requested KDTree was not found on disk' + msgs.newline() +
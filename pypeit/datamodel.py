@@ -1396,8 +1396,9 @@ class DataContainer:
         if verbose:
             msgs.info("Loading {} from {}".format(cls.__name__, ifile))
 
-        # Do it
-        with io.fits_open(ifile) as hdu:
+        # Do it; the files are small enough that gzipped files are
+        # decompressed in memory before being parsed
+        with io.fits_open(ifile, decompress=True) as hdu:
             obj = cls.from_hdu(hdu, chk_version=chk_version)
             if hasattr(obj, 'head0'):
                 obj.head0 = hdu[0].header
@@ -1406,7 +1407,8 @@ class DataContainer:
 
             # Master this and that
             if hasattr(cls, 'master_type'):
-                obj.master_key, obj.master_dir = masterframe.grab_key_mdir(ifile)
+                # Use the header already read instead of re-opening the file
+                obj.master_key, obj.master_dir = masterframe.grab_key_mdir(hdu[0].header)
                 if hasattr(obj, 'head0'):
                     if 'MSTRTYP' in obj.head0.keys():
                         if obj.head0['MSTRTYP'] != cls.master_type:
@@ -757,8 +757,10 @@ class FlatField(object):
             _flexure = 0. if self.wavetilts.spat_flexure is None else self.wavetilts.spat_flexure
             tilts = tracewave.fit2tilts(rawflat.shape, self.wavetilts['coeffs'][:,:,slit_idx],
                                         self.wavetilts['func2d'], spat_shift=-1*_flexure)
-            # Convert the tilt image to an image with the spectral pixel index
-            spec_coo = tilts * (nspec-1)
+            # Convert the tilt image to an image with the spectral pixel
+            # index.  The tilts aren't used again, so do it in place.
+            spec_coo = tilts
+            spec_coo *= nspec-1
 
             # Only include the trimmed set of pixels in the flat-field
             # fit along the spectral direction.
@@ -1194,10 +1196,12 @@ class FlatField(object):
             gpm = np.ones_like(rawflat, dtype=bool) if self.rawflatimg.bpm is None else (
                     1 - self.rawflatimg.bpm).astype(bool)
 
+        # NOTE: By default, the slit ID images only include the good
+        # slits (i.e., those with self.slits.mask == 0), so any pixel
+        # assigned to a slit is in a good slit.  Slit IDs can be
+        # negative, so only -1 identifies pixels outside all slits.
         slitid_img_init = self.slits.slit_img(pad=0, initial=True)
         slitid_img_trim = self.slits.slit_img(pad=-trim, initial=True)
-        # Find all good slits, and create a mask of pixels to include (True=include)
-        wgd = self.slits.spat_id[np.where(self.slits.mask == 0)]
         # Obtain the minimum and maximum wavelength of all slits
         mnmx_wv = np.zeros((self.slits.nslits, 2))
         for slit_idx, slit_spat in enumerate(self.slits.spat_id):
@@ -1215,7 +1219,7 @@ class FlatField(object):
         # Perform a simultaneous fit to all pixels in all slits to get a "global" shape of the flat spectrum.
         # This ensures that the final fit smoothly covers the full wavelength range covered on the detector.
         # Get the pixels containing good slits
-        spec_tot = np.isin(slitid_img_init, wgd)  # & (rawflat < nonlinear_counts)
+        spec_tot = slitid_img_init != -1  # & (rawflat < nonlinear_counts)
         # Apply the relative scaling
         rawflatscl = rawflat / relscl_model
         # Flat-field modeling is done in the log of the counts
@@ -1225,7 +1229,7 @@ class FlatField(object):
         ivar_log = gpm_log.astype(float) / 0.5 ** 2
         # Only include the trimmed set of pixels in the flat-field
         # fit along the spectral direction.
-        spec_gpm = np.isin((slitid_img_trim), wgd) & gpm_log  # & (rawflat < nonlinear_counts)
+        spec_gpm = (slitid_img_trim != -1) & gpm_log  # & (rawflat < nonlinear_counts)
         spec_nfit = np.sum(spec_gpm)
         spec_ntot = np.sum(spec_tot)
         msgs.info('Spectral fit of flatfield for {0}/{1} '.format(spec_nfit, spec_ntot)
@@ -24,6 +24,9 @@ class ArcImage(pypeitimage.PypeItImage):
     # Peg the version of this class to that of PypeItImage
     version = pypeitimage.PypeItImage.version
 
+    # Combined calibration frames do not need double precision
+    float_dtype = np.float32
+
     # I/O
     output_to_disk = ('ARC_IMAGE', 'ARC_FULLMASK', 'ARC_DETECTOR')
     hdu_prefix = 'ARC_'
@@ -40,6 +43,8 @@ class AlignImage(pypeitimage.PypeItImage):
     # Peg the version of this class to that of PypeItImage
     version = pypeitimage.PypeItImage.version
 
+    float_dtype = np.float32
+
     # I/O
     output_to_disk = ('ALIGN_IMAGE', 'ALIGN_FULLMASK', 'ALIGN_DETECTOR')
     hdu_prefix = 'ALIGN_'
@@ -56,6 +61,8 @@ class BiasImage(pypeitimage.PypeItImage):
     # Set the version of this class
     version = pypeitimage.PypeItImage.version
 
+    float_dtype = np.float32
+
     # Output to disk
     output_to_disk = ('BIAS_IMAGE', 'BIAS_DETECTOR')
     hdu_prefix = 'BIAS_'
@@ -70,6 +77,8 @@ class DarkImage(pypeitimage.PypeItImage):
     # Set the version of this class
     version = pypeitimage.PypeItImage.version
 
+    float_dtype = np.float32
+
     # Output to disk
     output_to_disk = ('DARK_IMAGE', 'DARK_DETECTOR')
     hdu_prefix = 'DARK_'
@@ -85,6 +94,8 @@ class TiltImage(pypeitimage.PypeItImage):
     # Peg the version of this class to that of PypeItImage
     version = pypeitimage.PypeItImage.version
 
+    float_dtype = np.float32
+
     # I/O
     output_to_disk = ('TILT_IMAGE', 'TILT_FULLMASK', 'TILT_DETECTOR')
     hdu_prefix = 'TILT_'
@@ -102,6 +113,8 @@ class TraceImage(pypeitimage.PypeItImage):
     # Peg the version of this class to that of PypeItImage
     version = pypeitimage.PypeItImage.version
 
+    float_dtype = np.float32
+
     # I/O
     output_to_disk = ('TRACE_IMAGE', 'TRACE_FULLMASK', 'TRACE_DETECTOR')
     hdu_prefix = 'TRACE_'
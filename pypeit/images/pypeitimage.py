@@ -53,6 +53,12 @@ class PypeItImage(datamodel.DataContainer):
     version = '1.0.1'
     """Datamodel version number"""
 
+    float_dtype = None
+    """
+    Data type for the floating-point images (``image``, ``ivar``, and
+    ``rn2img``).  If None, the images are kept as provided.
+    """
+
     datamodel = {'image': dict(otype=np.ndarray, atype=np.floating, descr='Main data image'),
                  'ivar': dict(otype=np.ndarray, atype=np.floating,
                               descr='Main data inverse variance image'),
@@ -110,6 +116,11 @@ class PypeItImage(datamodel.DataContainer):
         # everything but self in the instantiation call.
         args, _, _, values = inspect.getargvalues(inspect.currentframe())
         _d = {k: values[k] for k in args[1:]}
+        # Set the precision of the floating-point images
+        if self.float_dtype is not None:
+            for key in ['image', 'ivar', 'rn2img']:
+                if _d[key] is not None:
+                    _d[key] = np.asarray(_d[key]).astype(self.float_dtype, copy=False)
         # Init
         super(PypeItImage, self).__init__(d=_d)
 
@@ -362,16 +373,8 @@ class PypeItImage(datamodel.DataContainer):
         display.show_image(self.image, chname='image')
 
     def __repr__(self):
-        repr = '<{:s}: '.format(self.__class__.__name__)
-        # Image
-        rdict = {}
-        for attr in self.datamodel.keys():
-            if hasattr(self, attr) and getattr(self, attr) is not None:
-                rdict[attr] = True
-            else:
-                rdict[attr] = False
-        repr += ' images={}'.format(rdict)
-        repr = repr + '>'
-        return repr
+        # Flag which datamodel items are set
+        rdict = {attr: getattr(self, attr, None) is not None for attr in self.datamodel}
+        return '<{:s}:  images={}>'.format(self.__class__.__name__, rdict)
 
 
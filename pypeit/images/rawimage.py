@@ -248,19 +248,25 @@ class RawImage(object):
                 display.show_slits(viewer, ch, left, right)  # , slits.id)
 
         # Apply the relative spectral illumination
-        spec_illum = 1.0
+        spec_illum = None
         if self.par['use_specillum']:
             if flatimages is None or flatimages.get_spec_illum() is None:
                 msgs.error("Spectral illumination correction desired but not generated/provided.")
             else:
-                spec_illum = flatimages.get_spec_illum().copy()
+                spec_illum = flatimages.get_spec_illum()
 
         # Flat field -- We cannot do illumination flat without a pixel flat (yet)
         if self.par['use_pixelflat'] or self.par['use_illumflat']:
             if flatimages is None or flatimages.get_pixelflat() is None:
                 msgs.error("Flat fielding desired but not generated/provided.")
             else:
-                self.flatten(flatimages.get_pixelflat()/spec_illum, illum_flat=illum_flat, bpm=self.bpm)
+                # NOTE: flat.flatfield does not alter the flat, so the
+                # pixel flat is only copied if it needs to be divided by
+                # the spectral illumination.
+                pixel_flat = flatimages.get_pixelflat()
+                if spec_illum is not None:
+                    pixel_flat = pixel_flat / spec_illum
+                self.flatten(pixel_flat, illum_flat=illum_flat, bpm=self.bpm)
 
         # Fresh BPM
         bpm = self.spectrograph.bpm(self.filename, self.det, shape=self.image.shape)
@@ -8,6 +8,7 @@ Provides a set of I/O routines.
 
 """
 import os
+import io
 import sys
 import warnings
 import gzip
@@ -21,6 +22,13 @@ from configobj import ConfigObj
 from astropy.io import fits
 from astropy.table import Table
 
+# fitsio is optional; it is only used to speed up reading single image
+# extensions.  See `fits_read_image`.
+try:
+    import fitsio
+except ImportError:
+    fitsio = None
+
 from pypeit import par, msgs
 
 # These imports are largely just to make the versions available for
@@ -618,20 +626,20 @@ def write_to_fits(d, ofile, name=None, hdr=None, overwrite=False, checksum=True)
     `astropy.io.fits.HDUList`_ passed as (``d``).
 
     If the provided file name includes the '.gz' extension, the file
-    is first written using `astropy.io.fits.HDUList.writeto`_ and
-    then compressed using :func:`compress_file`.
+    is first written to an in-memory buffer using
+    `astropy.io.fits.HDUList.writeto`_ and the buffer is then
+    compressed directly to the output file.
     
     .. note::
 
         - If the root directory of the output does *not* exist, this
           method will create it.
-        - Compressing the file is generally slow, but following the
-          two-step process of running
-          `astropy.io.fits.HDUList.writeto`_ and then
-          :func:`compress_file` is generally faster than having
+        - Compressing the file is generally slow, but writing the
+          uncompressed file to a buffer and then compressing it in a
+          single write is much faster than having
           `astropy.io.fits.HDUList.writeto`_ do the compression,
-          particularly for files with many extensions (or at least
-          this was true in the past).
+          particularly for files with many extensions, because the
+          latter issues many small writes to the compressed stream.
 
     Args:
         d (:obj:`dict`, :obj:`list`, `numpy.ndarray`_, `astropy.table.Table`_, `astropy.io.fits.HDUList`_):
@@ -660,23 +668,24 @@ def write_to_fits(d, ofile, name=None, hdr=None, overwrite=False, checksum=True)
         warnings.warn('Making root directory for output file: {0}'.format(root))
         os.makedirs(root)
 
-    # Determine if the file should be compressed
-    _ofile = ofile[:ofile.rfind('.')] if ofile.split('.')[-1] == 'gz' else ofile
-
     _hdr = initialize_header() if hdr is None else hdr.copy()
 
-    # Construct the hdus and write the fits file.
-    fits.HDUList(d if isinstance(d, fits.HDUList) else 
-                 [fits.PrimaryHDU(header=_hdr)] + [write_to_hdu(d, name=name, hdr=_hdr)]
-                 ).writeto(_ofile, overwrite=True, checksum=checksum)
-
-    # Compress the file if the output filename has a '.gz' extension;
-    # this is slow but still faster than if you have astropy.io.fits do
-    # it directly
-    # TODO: use pypmsgs?
-    if _ofile is not ofile:
-        pypeit.msgs.info('Compressing file: {0}'.format(_ofile))
-        compress_file(_ofile, overwrite=True)
+    # Construct the hdus
+    hdu = fits.HDUList(d if isinstance(d, fits.HDUList) else
+                       [fits.PrimaryHDU(header=_hdr)] + [write_to_hdu(d, name=name, hdr=_hdr)])
+
+    if ofile.split('.')[-1] != 'gz':
+        hdu.writeto(ofile, overwrite=True, checksum=checksum)
+    else:
+        # Write the uncompressed file to memory and then compress the
+        # full buffer in one go; this is much faster than if you have
+        # astropy.io.fits do it directly and avoids writing the
+        # uncompressed file to disk.
+        pypeit.msgs.info('Compressing file: {0}'.format(ofile))
+        buf = io.BytesIO()
+        hdu.writeto(buf, checksum=checksum)
+        with gzip.open(ofile, 'wb') as f:
+            f.write(buf.getbuffer())
     pypeit.msgs.info('File written to: {0}'.format(ofile))
 
 
@@ -754,19 +763,62 @@ def hdu_iter_by_ext(hdu, ext=None, hdu_prefix=None):
 
     return ext if isinstance(ext, list) else [ext], _hdu
 
-def fits_open(filename, **kwargs):
+def fits_open(filename, decompress=False, **kwargs):
     """
     Thin wrapper around astropy.io.fits.open that handles empty padding bytes.
 
     Args:
         filename (:obj:`str`):
             File name for the fits file to open
+        decompress (:obj:`bool`, optional):
+            If True and the file has a '.gz' extension, decompress the
+            full file into memory in a single read before opening it.
+            This is faster than having astropy.io.fits read through the
+            compressed file as it parses each extension, but the
+            decompressed file must fit in memory.
     Returns:
         hdulist: an :obj:`astropy.io.fits.HDUList` object that contains all the
         HDUs in the fits file
     """
+    _filename = filename
+    if decompress and isinstance(filename, str) and filename.split('.')[-1] == 'gz':
+        with gzip.open(filename, 'rb') as f:
+            _filename = io.BytesIO(f.read())
     try:
-        return fits.open(filename, **kwargs)
+        return fits.open(_filename, **kwargs)
     except OSError as e:
         msgs.warn('Error opening {0}: {1}'.format(filename, str(e)) + '\nTrying again, assuming the error was a header problem.')
-        return fits.open(filename, ignore_missing_end=True, **kwargs)
+        if isinstance(_filename, io.BytesIO):
+            _filename.seek(0)
+        return fits.open(_filename, ignore_missing_end=True, **kwargs)
+
+
+def fits_read_image(filename, ext):
+    """
+    Read the image data from a single extension of a fits file.
+
+    If `fitsio` is installed, it is used to read the data directly
+    into a numpy array; otherwise, this falls back to
+    :func:`fits_open`.
+
+    Args:
+        filename (:obj:`str`):
+            File name for the fits file to read
+        ext (:obj:`int`, :obj:`str`):
+            Extension with the image data
+
+    Returns:
+        `numpy.ndarray`_: The image data, or None if the extension has
+        no data.
+    """
+    if fitsio is not None:
+        with fitsio.FITS(filename) as f:
+            return f[ext].read() if f[ext].has_data() else None
+    # NOTE: `astropy.io.fits.open` only parses the file up to the
+    # requested extension, which matters for multi-extension files where
+    # we only want one detector.  The data are read into memory instead
+    # of memory-mapped; returning memory-mapped data keeps the mmap (and
+    # its file handle) open after the file is closed, which accumulates
+    # when many files are read.
+    with fits_open(filename, memmap=False) as hdu:
+        return hdu[ext].data
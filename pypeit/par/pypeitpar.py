@@ -3634,7 +3634,7 @@ class CalibrationsPar(ParSet):
                  pinholeframe=None, alignframe=None, alignment=None, traceframe=None,
                  illumflatframe=None, skyframe=None,
                  standardframe=None, flatfield=None, wavelengths=None, slitedges=None, tilts=None,
-                 raise_chk_error=None):
+                 raise_chk_error=None, parallel_build=None):
 
 
         # Grab the parameter names and values from the function
@@ -3669,6 +3669,11 @@ class CalibrationsPar(ParSet):
         dtypes['bpm_usebias'] = bool
         descr['bpm_usebias'] = 'Make a bad pixel mask from bias frames? Bias frames must be provided.'
 
+        defaults['parallel_build'] = False
+        dtypes['parallel_build'] = bool
+        descr['parallel_build'] = 'Run independent calibration steps in parallel threads.  ' \
+                                  'Ignored if the calibrations are shown as they are built.'
+
         # Calibration Frames
         defaults['biasframe'] = FrameGroupPar(frametype='bias',
                                               process=ProcessImagesPar(apply_gain=False,
@@ -3784,7 +3789,7 @@ class CalibrationsPar(ParSet):
         k = np.array([*cfg.keys()])
 
         # Basic keywords
-        parkeys = [ 'master_dir', 'setup', 'bpm_usebias', 'raise_chk_error']
+        parkeys = [ 'master_dir', 'setup', 'bpm_usebias', 'raise_chk_error', 'parallel_build']
 
         allkeys = parkeys + ['biasframe', 'darkframe', 'arcframe', 'tiltframe', 'pixelflatframe',
                              'illumflatframe',
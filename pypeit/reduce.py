@@ -1101,6 +1101,9 @@ class MultiSlitReduce(Reduce):
         # overkill since nothing is extracted
         self.sobjs = sobjs.copy()  # WHY DO WE CREATE A COPY HERE?
 
+        # Spectral pixel sampling shared by all slits
+        piximg = self.tilts * (self.tilts.shape[0]-1)
+
         # Loop on slits
         for slit_idx in gdslits:
             slit_spat = self.slits.spat_id[slit_idx]
@@ -1127,7 +1130,8 @@ class MultiSlitReduce(Reduce):
                     sn_gauss=self.par['reduce']['extraction']['sn_gauss'],
                     show_profile=show_profile,
                     use_2dmodel_mask=self.par['reduce']['extraction']['use_2dmodel_mask'],
-                    no_local_sky=self.par['reduce']['skysub']['no_local_sky'])
+                    no_local_sky=self.par['reduce']['skysub']['no_local_sky'],
+                    piximg=piximg)
 
         # Set the bit for pixels which were masked by the extraction.
         # For extractmask, True = Good, False = Bad
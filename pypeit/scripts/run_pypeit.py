@@ -7,7 +7,6 @@
 This script runs PypeIt
 """
 
-import numpy as np
 from pypeit import msgs
 
 def run_pypeit_usage():
@@ -32,7 +31,16 @@ def run_pypeit_usage():
     return descs
 
 
-def parse_args(options=None, return_parser=False):
+_parser = None
+"""
+Command-line parser, constructed on the first call to :func:`parse_args`.
+"""
+
+
+def _build_parser():
+    """
+    Construct the command-line parser.
+    """
     import argparse
 
     parser = argparse.ArgumentParser(description=run_pypeit_usage(),
@@ -70,18 +78,26 @@ def parse_args(options=None, return_parser=False):
 #                         help='Number of CPUs for parallel processing')
 #    parser.print_help()
 
+    return parser
+
+
+def parse_args(options=None, return_parser=False):
+    # Building the parser requires importing all the spectrographs for
+    # the usage description, so only do it once
+    global _parser
+    if _parser is None:
+        _parser = _build_parser()
+
     if return_parser:
-        return parser
+        return _parser
 
-    return parser.parse_args() if options is None else parser.parse_args(options)
+    return _parser.parse_args() if options is None else _parser.parse_args(options)
 
 
 def main(args):
 
     import os
 
-    from pypeit import pypeit
-
     # Initiate logging for bugs and command line help
     # These messages will not be saved to a log file
     # Set the default variables
@@ -95,9 +111,12 @@ def main(args):
         msgs.error("Bad extension for PypeIt reduction file."+msgs.newline()+".pypeit is required")
     logname = splitnm[0] + ".log"
 
+    # Only import the pipeline once the input file has been checked
+    from pypeit import pypeit
+
     # Instantiate the main pipeline reduction object
     pypeIt = pypeit.PypeIt(args.pypeit_file, verbosity=args.verbosity,
-                           reuse_masters=np.invert(args.do_not_reuse_masters),
+                           reuse_masters=not args.do_not_reuse_masters,
                            overwrite=args.overwrite,
                            redux_path=args.redux_path,
                            calib_only=args.calib_only,
@@ -23,6 +23,20 @@ from pypeit.bitmask import BitMask
 from pypeit.spectrographs import slitmask
 
 
+def _as_1d_int(indx):
+    """
+    Convert one or more indices into a 1D integer array.
+
+    Args:
+        indx (:obj:`int`, array-like):
+            One or more indices.
+
+    Returns:
+        `numpy.ndarray`_: 1D integer array with the indices.
+    """
+    return np.asarray(indx, dtype=int).reshape(-1)
+
+
 class SlitTraceBitMask(BitMask):
     """
     Mask bits used during slit tracing.
@@ -212,23 +226,35 @@ class SlitTraceSet(datamodel.DataContainer):
         # Center is always defined by the original traces, not the
         # tweaked ones. This means that the slit IDs are always tied
         # to the original traces, not the tweaked ones.
-        self.center = (self.left_init+self.right_init)/2
+        self.center = np.add(self.left_init, self.right_init)
+        self.center *= 0.5
 
         if self.nspat is None:
             # TODO: May want nspat to be a required argument given the
             # only other option is this kludge, which should basically
             # never be useful.
-            self.nspat = int(np.amax(np.append(self.left_init, self.right_init)))
+            self.nspat = int(max(np.amax(self.left_init), np.amax(self.right_init)))
         if self.spat_id is None:
             self.spat_id = np.round(self.center[int(np.round(0.5 * self.nspec)), :]).astype(int)
+
+        # Store the edges in single precision.  This is more than
+        # sufficient for pixel coordinates and halves the memory
+        # traffic of the methods that work with the full edge arrays
+        # (e.g., slit_img).  This is done after setting spat_id so that
+        # the IDs are identical to those from the input edges.
+        for key in ['left_init', 'right_init', 'left_tweak', 'right_tweak', 'center']:
+            if self[key] is not None:
+                self[key] = np.ascontiguousarray(self[key], dtype=np.float32)
         if self.PYP_SPEC is None:
             self.PYP_SPEC = 'unknown'
-        if self.mask_init is None:
-            self.mask_init = np.zeros(self.nslits, dtype=self.bitmask.minimum_dtype())
-        if self.specmin is None:
-            self.specmin = np.full(self.nslits, -1, dtype=float)
-        if self.specmax is None:
-            self.specmax = np.full(self.nslits, self.nspec, dtype=float)
+        # Set the default mask and spectral limits, and make sure any
+        # provided values are at least 1D arrays.
+        self.mask_init = np.zeros(self.nslits, dtype=self.bitmask.minimum_dtype()) \
+                            if self.mask_init is None else np.atleast_1d(self.mask_init)
+        self.specmin = np.full(self.nslits, -1, dtype=float) \
+                            if self.specmin is None else np.atleast_1d(self.specmin)
+        self.specmax = np.full(self.nslits, self.nspec, dtype=float) \
+                            if self.specmax is None else np.atleast_1d(self.specmax)
 
         # If the echelle order is provided, check that the number of
         # orders matches the number of provided "slits"
@@ -236,11 +262,6 @@ class SlitTraceSet(datamodel.DataContainer):
             msgs.error('Number of provided echelle orders does not match the number of '
                        'order traces.')
 
-        # Make sure mask, specmin, and specmax are at least 1D arrays.
-        # TODO: Is there a way around this?
-        self.mask_init = np.atleast_1d(self.mask_init)
-        self.specmin = np.atleast_1d(self.specmin)
-        self.specmax = np.atleast_1d(self.specmax)
         if self.slitbitm is None:
             self.slitbitm = ','.join(list(self.bitmask.keys()))
         else:
@@ -391,7 +412,7 @@ class SlitTraceSet(datamodel.DataContainer):
         Returns:
             `numpy.ndarray`_: Slit lengths.
         """
-        left, right, _ = self.select_edges(initial=initial)
+        left, right, _ = self.select_edges(initial=initial, copy=False)
         slitlen = right - left
         if median is True:
             slitlen = np.median(slitlen, axis=1)
@@ -427,7 +448,7 @@ class SlitTraceSet(datamodel.DataContainer):
         """
         # Grab the central trace, if none was provided
         if trace_cen is None:
-            left, right, _ = self.select_edges(initial=initial, flexure=flexure)
+            left, right, _ = self.select_edges(initial=initial, flexure=flexure, copy=False)
             trace_cen = 0.5 * (left + right)
 
         # Initialise the output
@@ -450,7 +471,7 @@ class SlitTraceSet(datamodel.DataContainer):
             decimg[onslit] = world_dec.copy()
         return raimg, decimg, minmax
 
-    def select_edges(self, initial=False, flexure=None):
+    def select_edges(self, initial=False, flexure=None, copy=True):
         """
         Select between the initial or tweaked slit edges and allow for
         flexure correction.
@@ -467,13 +488,16 @@ class SlitTraceSet(datamodel.DataContainer):
                 the tweaked edges, set this to True.
             flexure (:obj:`float`, optional):
                 If provided, offset each slit by this amount
+            copy (:obj:`bool`, optional):
+                Return copies of the arrays.  Methods that only read
+                the edges set this to False to avoid copying the full
+                trace arrays.
 
         Returns:
             tuple: Returns the full arrays containing the left and right
             edge coordinates and the mask, respectively.
-            These are returned as copies.
+            These are returned as copies if ``copy`` is True.
         """
-        # TODO: Add a copy argument?
         if self.left_tweak is not None and self.right_tweak is not None and not initial:
             left, right = self.left_tweak, self.right_tweak
         else:
@@ -486,6 +510,8 @@ class SlitTraceSet(datamodel.DataContainer):
             left, right = self.left_flexure, self.right_flexure
 
         # Return
+        if not copy:
+            return left, right, self.mask
         return left.copy(), right.copy(), self.mask.copy()
 
     def slit_img(self, pad=None, slitidx=None, initial=False, flexure=None,
@@ -498,7 +524,9 @@ class SlitTraceSet(datamodel.DataContainer):
         image. Each pixel in the image is set to the index
         of its associated slit (i.e, the pixel value is
         :math:`0..N_{\rm slit}-1`). Pixels not associated with any
-        slit are given values of -1.
+        slit are given values of -1.  To limit the memory footprint,
+        the image is a 16-bit integer array unless the slit
+        identifiers cannot be stored with that precision.
 
         The width of the slit is extended at either edge by a fixed
         number of pixels using the `pad` parameter in :attr:`par`.
@@ -556,13 +584,12 @@ class SlitTraceSet(datamodel.DataContainer):
 
         # Pixel coordinates
         spat = np.arange(self.nspat)
-        spec = np.arange(self.nspec)
 
-        left, right, _ = self.select_edges(initial=initial, flexure=flexure)
+        left, right, _ = self.select_edges(initial=initial, flexure=flexure, copy=False)
 
         # Choose the slits to use
         if slitidx is not None:
-            slitidx = np.atleast_1d(slitidx).ravel()
+            slitidx = _as_1d_int(slitidx)
         else:
             bpm = self.mask.astype(bool)
             if exclude_flag:
@@ -574,16 +601,65 @@ class SlitTraceSet(datamodel.DataContainer):
 
         # Find the pixels in each slit, limited by the minimum and
         # maximum spectral position.
-        slitid_img = np.full((self.nspec,self.nspat), -1, dtype=int)
+        ids = (self.spat_id[slitidx] if use_spatial else slitidx) if slitidx.size > 0 else [0]
+        dtype = np.int16 if np.amin(ids) >= np.iinfo(np.int16).min \
+                                and np.amax(ids) <= np.iinfo(np.int16).max else int
+        slitid_img = np.full((self.nspec,self.nspat), -1, dtype=dtype)
+        # Only the rows with specmin < spec < specmax can be in each
+        # slit
+        spec_s = np.clip(np.floor(self.specmin)+1, 0, self.nspec).astype(int)
+        spec_e = np.maximum(spec_s, np.clip(np.ceil(self.specmax), 0, self.nspec).astype(int))
         for i in slitidx:
             slit_id = self.spat_id[i] if use_spatial else i
-            indx = (spat[None,:] > left[:,i,None] - _pad[0]) \
-                        & (spat[None,:] < right[:,i,None] + _pad[1]) \
-                        & (spec > self.specmin[i])[:,None] & (spec < self.specmax[i])[:,None]
-            slitid_img[indx] = slit_id
+            rs, re = spec_s[i], spec_e[i]
+            _left = left[rs:re,i] - _pad[0]
+            _right = right[rs:re,i] + _pad[1]
+            # Only consider the columns spanned by the slit.  Pixels
+            # with _left < spat < _right are in the slit, which means
+            # the first possible column is floor(min(_left))+1 and the
+            # last is ceil(max(_right))-1.
+            s, e = SlitTraceSet._spatial_range(_left, _right, self.nspat)
+            if e <= s:
+                continue
+            # Combine the conditions in place to limit the number of
+            # temporary images
+            indx = spat[None,s:e] > _left[:,None]
+            indx &= spat[None,s:e] < _right[:,None]
+            slitid_img[rs:re,s:e][indx] = slit_id
+
         # Return
         return slitid_img
 
+    @staticmethod
+    def _spatial_range(left, right, nspat):
+        """
+        Find the range of spatial pixels that fall between the provided
+        left and right edges.
+
+        Args:
+            left (`numpy.ndarray`_):
+                Left edge of a single slit as a function of spectral
+                position.
+            right (`numpy.ndarray`_):
+                Right edge of the same slit.
+            nspat (:obj:`int`):
+                Number of spatial pixels in the image.
+
+        Returns:
+            :obj:`tuple`: The first and one more than the last spatial
+            pixel that can have ``left < spat < right`` in any spectral
+            row, limited to the image.  If no pixel can be in the slit,
+            the two values are equal.
+        """
+        # Ignore rows where either edge is undefined; no pixel in these
+        # rows satisfies the comparison.
+        indx = np.logical_not(np.isnan(left) | np.isnan(right))
+        if not np.any(indx):
+            return 0, 0
+        s = int(np.clip(np.floor(np.amin(left[indx]))+1, 0, nspat))
+        e = int(np.clip(np.ceil(np.amax(right[indx])), 0, nspat))
+        return s, max(s, e)
+
     def spatial_coordinate_image(self, slitidx=None, full=False, slitid_img=None,
                                  pad=None, initial=False, flexure_shift=None):
         r"""
@@ -631,7 +707,7 @@ class SlitTraceSet(datamodel.DataContainer):
             full image.
         """
         # Slit indices to include
-        _slitidx = np.arange(self.nslits) if slitidx is None else np.atleast_1d(slitidx).ravel()
+        _slitidx = np.arange(self.nslits) if slitidx is None else _as_1d_int(slitidx)
         if full and len(_slitidx) > 1:
             msgs.error('For a full image with the slit coordinates, must select a single slit.')
 
@@ -643,7 +719,8 @@ class SlitTraceSet(datamodel.DataContainer):
                 msgs.error('Provided slit ID image does not have the correct shape!')
 
         # Choose the slit edges to use
-        left, right, _ = self.select_edges(initial=initial, flexure=flexure_shift)
+        left, right, _ = self.select_edges(initial=initial, flexure=flexure_shift,
+                                           copy=False)
 
         # Slit width
         slitwidth = right - left
@@ -657,16 +734,41 @@ class SlitTraceSet(datamodel.DataContainer):
             # TODO: Shouldn't this fault?
             msgs.warn('Slits {0} have negative (or 0) slit width!'.format(bad_slits))
 
-        # Output image
+        if full:
+            # Compute the coordinates in place in the output image
+            coo_img = np.empty((self.nspec,self.nspat), dtype=float)
+            np.subtract(np.arange(self.nspat)[None,:], left[:,_slitidx[0],None], out=coo_img)
+            coo_img /= slitwidth[:,_slitidx[0],None]
+            return coo_img
+
+        # Only compute the coordinates of the pixels in the selected
+        # slits.  Use a lookup table to convert the slit ID of each
+        # pixel to the index of its slit.
+        spat_id = self.spat_id[_slitidx]
+        in_lut = spat_id >= 0
+        slit_lut = np.full(np.amax(spat_id[in_lut])+1 if np.any(in_lut) else 0, -1, dtype=int)
+        slit_lut[spat_id[in_lut]] = _slitidx[in_lut]
+        spec_indx, spat_indx = np.where((slitid_img >= 0) & (slitid_img < slit_lut.size))
+        slit_indx = slit_lut[slitid_img[spec_indx,spat_indx]]
+        keep = slit_indx >= 0
+        spec_indx, spat_indx, slit_indx = [spec_indx[keep]], [spat_indx[keep]], [slit_indx[keep]]
+        # Negative slit IDs (e.g., for a slit with a NaN center) cannot
+        # be included in the lookup table; find their pixels directly
+        for i in _slitidx[np.invert(in_lut)]:
+            _spec_indx, _spat_indx = np.where(slitid_img == self.spat_id[i])
+            spec_indx += [_spec_indx]
+            spat_indx += [_spat_indx]
+            slit_indx += [np.full(_spec_indx.size, i, dtype=int)]
+        spec_indx = np.concatenate(spec_indx)
+        spat_indx = np.concatenate(spat_indx)
+        slit_indx = np.concatenate(slit_indx)
+
+        # Output image; gather the edges using the indices into the
+        # flattened arrays
+        edge_indx = spec_indx*self.nslits + slit_indx
         coo_img = np.zeros((self.nspec,self.nspat), dtype=float)
-        spat = np.arange(self.nspat)
-        for i in _slitidx:
-            coo = (spat[None,:] - left[:,i,None])/slitwidth[:,i,None]
-            if not full:
-                indx = slitid_img == self.spat_id[i]
-                coo_img[indx] = coo[indx]
-            else:
-                coo_img = coo
+        coo_img[spec_indx,spat_indx] = (spat_indx - np.take(left, edge_indx)) \
+                                            / np.take(slitwidth, edge_indx)
         return coo_img
 
     def spatial_coordinates(self, initial=False, flexure=None):
@@ -690,7 +792,7 @@ class SlitTraceSet(datamodel.DataContainer):
             spatial coordinates.
         """
         # TODO -- Confirm it makes sense to pass in flexure
-        left, right, _ = self.select_edges(initial=initial, flexure=flexure)
+        left, right, _ = self.select_edges(initial=initial, flexure=flexure, copy=False)
         return SlitTraceSet.slit_spat_pos(left, right, self.nspat)
 
     @staticmethod
@@ -721,7 +823,11 @@ class SlitTraceSet(datamodel.DataContainer):
         if left.shape != right.shape:
             msgs.error('Left and right traces must have the same shape.')
         nspec = left.shape[0]
-        return (left[nspec//2,:] + right[nspec//2,:])/2/nspat
+        # Compute the result with a single allocation
+        spat_pos = np.add(left[nspec//2,:], right[nspec//2,:],
+                          dtype=np.result_type(left, right, np.float64))
+        spat_pos *= 0.5/nspat
+        return spat_pos
 
     def mask_add_missing_obj(self, sobjs, expected_objpos, fwhm, median_off, slits_left, slits_right):
         """
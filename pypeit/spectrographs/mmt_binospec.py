@@ -5,6 +5,7 @@ Module for MMT/BINOSPEC specific methods.
 """
 import os
 import glob
+import functools
 from pkg_resources import resource_filename
 
 from IPython import embed
@@ -351,7 +352,7 @@ class MMTBINOSPECSpectrograph(spectrograph.Spectrograph):
 
         # First read over the header info to determine the size of the output array...
         datasec = head1['DATASEC']
-        x1, x2, y1, y2 = np.array(parse.load_sections(datasec, fmt_iraf=False)).flatten()
+        x1, x2, y1, y2 = _load_sections(datasec)
         nxb = x1 - 1
 
         # determine the output array size...
@@ -363,8 +364,9 @@ class MMTBINOSPECSpectrograph(spectrograph.Spectrograph):
 
         # allocate output array...
         array = np.zeros((nx, ny))
-        rawdatasec_img = np.zeros_like(array, dtype=int)
-        oscansec_img = np.zeros_like(array, dtype=int)
+        # The amplifier images only hold values from 0 to 4
+        rawdatasec_img = np.zeros_like(array, dtype=np.int8)
+        oscansec_img = np.zeros_like(array, dtype=np.int8)
 
         if det == 1:  # A DETECTOR
             order = range(1, 5, 1)
@@ -385,34 +387,55 @@ class MMTBINOSPECSpectrograph(spectrograph.Spectrograph):
             ys = iny * kk
             yn = ys + iny
 
-            b1, b2, b3, b4 = np.array(parse.load_sections(biassec, fmt_iraf=False)).flatten()
-
-            if kk == 0:
-                array[b2:inx+b2,:iny] = data #*1.028
-                rawdatasec_img[b2:inx+b2,:iny] = kk + 1
-                array[:b2,:iny] = overscan
-                oscansec_img[2:b2,:iny] = kk + 1
-            elif kk == 1:
-                array[b2+inx:2*inx+b2,:iny] = np.flipud(data) #* 1.115
-                rawdatasec_img[b2+inx:2*inx+b2:,:iny] = kk + 1
-                array[2*inx+b2:,:iny] = overscan
-                oscansec_img[2*inx+b2:,:iny] = kk + 1
-            elif kk == 2:
-                array[b2+inx:2*inx+b2,iny:] = np.fliplr(np.flipud(data)) #* 1.047
-                rawdatasec_img[b2+inx:2*inx+b2,iny:] = kk + 1
-                array[2*inx+b2:, iny:] = overscan
-                oscansec_img[2*inx+b2:, iny:] = kk + 1
-            elif kk == 3:
-                array[b2:inx+b2,iny:] = np.fliplr(data) #* 1.045
-                rawdatasec_img[b2:inx+b2,iny:] = kk + 1
-                array[:b2,iny:] = overscan
-                oscansec_img[2:b2,iny:] = kk + 1
+            b1, b2, b3, b4 = _load_sections(biassec)
+
+            # Placement of each amplifier in the output array: the
+            # rows for the data, the step used to flip the data along
+            # each axis, the rows for the overscan, and the rows
+            # flagged as overscan.
+            lo_data, hi_data = slice(b2, inx+b2), slice(b2+inx, 2*inx+b2)
+            lo_os, hi_os = slice(None, b2), slice(2*inx+b2, None)
+            data_rows, flip, os_rows, os_flag_rows \
+                    = [(lo_data, (1, 1), lo_os, slice(2, b2)),      #*1.028
+                       (hi_data, (-1, 1), hi_os, hi_os),            #*1.115
+                       (hi_data, (-1, -1), hi_os, hi_os),           #*1.047
+                       (lo_data, (1, -1), lo_os, slice(2, b2))][kk] #*1.045
+            cols = slice(None, iny) if kk < 2 else slice(iny, None)
+
+            array[data_rows,cols] = data[::flip[0],::flip[1]]
+            rawdatasec_img[data_rows,cols] = kk + 1
+            array[os_rows,cols] = overscan
+            oscansec_img[os_flag_rows,cols] = kk + 1
 
         # Need the exposure time
         exptime = hdu[self.meta['exptime']['ext']].header[self.meta['exptime']['card']]
-        # Return, transposing array back to orient the overscan properly
-        return detector_par, np.fliplr(np.flipud(array)), hdu, exptime, np.fliplr(np.flipud(rawdatasec_img)), \
-               np.fliplr(np.flipud(oscansec_img))
+        # Return, flipping the arrays back to orient the overscan
+        # properly.  NOTE: Like the flips used when inserting the
+        # amplifier data above, these are views, not copies.
+        return detector_par, array[::-1,::-1], hdu, exptime, rawdatasec_img[::-1,::-1], \
+               oscansec_img[::-1,::-1]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_sections(section):
+    """
+    Parse a python-formatted detector section into its flattened
+    limits.
+
+    This is a cached wrapper for
+    :func:`pypeit.core.parse.load_sections`; the sections are
+    typically the same for all amplifiers and files, so they generally
+    only need to be parsed once.
+
+    Args:
+        section (:obj:`str`):
+            Section string of the form ``[x1:x2,y1:y2]``.
+
+    Returns:
+        :obj:`tuple`: The four integers ``x1, x2, y1, y2``.
+    """
+    (x1, x2), (y1, y2) = parse.load_sections(section, fmt_iraf=False)
+    return x1, x2, y1, y2
 
 
 def binospec_read_amp(inp, ext):
@@ -457,7 +480,7 @@ def binospec_read_amp(inp, ext):
 
     # parse the DATASEC keyword to determine the size of the science region (unbinned)
     datasec = header['DATASEC']
-    xdata1, xdata2, ydata1, ydata2 = np.array(parse.load_sections(datasec, fmt_iraf=False)).flatten()
+    xdata1, xdata2, ydata1, ydata2 = _load_sections(datasec)
     datasec = '[{:}:{:},{:}:{:}]'.format(xdata1 - 1, xdata2, ydata1-1, ydata2)
 
     #TODO: Since pypeit can only subtract overscan along one axis, I'm subtract the overscan here using median method.
@@ -477,7 +500,7 @@ def binospec_read_amp(inp, ext):
 
     # Overscan
     biassec = '[0:{:},{:}:{:}]'.format(xdata1-1, ydata1-1, ydata2)
-    xos1, xos2, yos1, yos2 = np.array(parse.load_sections(biassec, fmt_iraf=False)).flatten()
+    xos1, xos2, yos1, yos2 = _load_sections(biassec)
     overscan = np.zeros_like(temp[xos1:xos2, yos1:yos2]) # Give a zero fake overscan at the edge of each amplifiers
     #overscan = temp[xos1:xos2,yos1:yos2]
 
@@ -10,10 +10,13 @@ import shutil
 
 import numpy as np
 
+from astropy.io import fits
+
 from pypeit import calibrations
 from pypeit.par import pypeitpar
 from pypeit.spectrographs.util import load_spectrograph
 from pypeit import wavecalib
+from pypeit.pypmsgs import PypeItError
 from IPython import embed
 
 from pypeit.tests.tstutils import dev_suite_required, dummy_fitstbl
@@ -118,6 +121,56 @@ def test_bpm(multi_caliBrate):
     bpm = multi_caliBrate.get_bpm()
     assert bpm.shape == (2048,350)
     assert np.sum(bpm) == 0.
+    # Second call should reuse the cached BPM, and changing the returned
+    # BPM should not alter the cached version
+    bpm[0,0] = 1
+    _bpm = multi_caliBrate.get_bpm()
+    assert _bpm is not bpm, 'Should be a new copy'
+    assert np.sum(_bpm) == 0., 'Cached BPM should not have been altered'
+
+
+def test_bpm_cache_frames(multi_caliBrate, fitstbl, tmp_path):
+    # Two science frames with the same setup, binning, and master key
+    # that only differ in a header value used to build the mask
+    fitstbl['directory'] = [str(tmp_path)]*len(fitstbl)
+    frames = fitstbl.find_frames('science', index=True)[:2]
+    for frame, ampmode in zip(frames, ['ALL', 'TBO']):
+        fitstbl['filename'][frame] = '{0}.fits'.format(ampmode)
+        hdr = fits.Header()
+        hdr['AMPMODE'] = ampmode
+        fits.PrimaryHDU(header=hdr).writeto(str(tmp_path / fitstbl['filename'][frame]))
+    spectrograph = load_spectrograph('shane_kast_blue')
+    spectrograph.bpm = lambda filename, det, shape=None, msbias=None: \
+            np.full((20,10), fits.getheader(filename)['AMPMODE'] == 'TBO', dtype=np.int8)
+
+    caliBrate = calibrations.MultiSlitCalibrations(fitstbl, multi_caliBrate.par, spectrograph,
+                                                   data_path('Masters'))
+    master_keys = []
+    for frame, bad in zip(frames, [0, 1]):
+        caliBrate.set_config(frame, 1)
+        assert np.all(caliBrate.get_bpm() == bad), 'Should not reuse the BPM of another frame'
+        master_keys += [caliBrate.master_key_dict['bpm']]
+    assert master_keys[0] == master_keys[1], 'Frames should share the same master key'
+
+
+@pytest.mark.parametrize('parallel_build', [False, True])
+def test_failed_step(multi_caliBrate, parallel_build):
+    # Replace each step with a stub; the arc step fails while the slits
+    # step, which does not depend on it, succeeds
+    run = []
+    def stub(step, fail=False):
+        def _step():
+            run.append(step)
+            if fail:
+                multi_caliBrate._fail_step()
+        return _step
+    for step in multi_caliBrate.steps:
+        setattr(multi_caliBrate, f'get_{step}', stub(step, fail=step == 'arc'))
+    multi_caliBrate.parallel_build = parallel_build
+    multi_caliBrate.run_the_steps()
+    assert not multi_caliBrate.success, 'Calibrations should have failed'
+    assert multi_caliBrate.failed_step == 'get_arc', 'Wrong failed step'
+    assert 'wv_calib' not in run, 'Should not run steps after the failure'
 
 
 @dev_suite_required
@@ -0,0 +1,26 @@
+"""
+Module to run tests on pypeit.io
+"""
+import pytest
+
+import numpy as np
+
+from astropy.io import fits
+
+from pypeit import io
+
+
+@pytest.mark.parametrize('use_fitsio', [False, True])
+def test_fits_read_image(tmp_path, monkeypatch, use_fitsio):
+    if use_fitsio and io.fitsio is None:
+        pytest.skip('fitsio is not installed')
+    if not use_fitsio:
+        monkeypatch.setattr(io, 'fitsio', None)
+
+    img = np.arange(200, dtype=float).reshape(20,10)
+    ofile = str(tmp_path / 'test_read_image.fits')
+    fits.HDUList([fits.PrimaryHDU(), fits.ImageHDU(data=img, name='DET01')]).writeto(ofile)
+
+    assert np.array_equal(io.fits_read_image(ofile, 1), img), 'Bad image'
+    assert np.array_equal(io.fits_read_image(ofile, 'DET01'), img), 'Bad image'
+    assert io.fits_read_image(ofile, 0) is None, 'Extension without data should return None'
@@ -7,6 +7,7 @@ import pytest
 import numpy as np
 
 from pypeit.images import pypeitimage
+from pypeit.images import buildimage
 
 def data_path(filename):
     data_dir = os.path.join(os.path.dirname(__file__), 'files')
@@ -33,3 +34,16 @@ def test_full():
     assert isinstance(_pypeitImage.image, np.ndarray)
     assert _pypeitImage.ivar is None
 
+
+
+def test_float_dtype():
+    img = np.ones((10, 10))
+    # Only the calibration images are converted to single precision
+    pypeitImage = pypeitimage.PypeItImage(img, ivar=img, rn2img=img)
+    assert pypeitImage.image.dtype == np.float64, 'Precision should be kept'
+    assert pypeitImage.ivar.dtype == np.float64, 'Precision should be kept'
+    assert pypeitImage.rn2img.dtype == np.float64, 'Precision should be kept'
+    biasImage = buildimage.BiasImage.from_pypeitimage(pypeitImage)
+    assert biasImage.image.dtype == np.float32, 'Calibration image should be single precision'
+    assert biasImage.ivar.dtype == np.float32, 'Calibration image should be single precision'
+    assert biasImage.rn2img.dtype == np.float32, 'Calibration image should be single precision'
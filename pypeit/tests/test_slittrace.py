@@ -118,3 +118,80 @@ def test_io_single():
     os.remove(tst_file)
 
 
+
+
+def test_slit_img():
+    # Tilted, overlapping slits with a limited spectral range
+    nspec, nspat = 100, 50
+    spec = np.arange(nspec)
+    left = np.column_stack([2.3 + 0.05*spec, 15.5 + 0.05*spec, 30.0 - 0.02*spec])
+    right = left + np.array([12.2, 11.0, 15.7])
+    slits = SlitTraceSet(left, right, 'MultiSlit', nspat=nspat, PYP_SPEC='dummy',
+                         specmin=np.array([-1., 10.5, -1.]),
+                         specmax=np.array([nspec, 90., 60.]))
+
+    # Brute-force construction; later slits take precedence
+    left, right, _ = slits.select_edges()
+    spat = np.arange(nspat)
+    for pad in [0, 2, (1, -2)]:
+        _pad = pad if isinstance(pad, tuple) else (pad, pad)
+        ref = np.full((nspec, nspat), -1, dtype=int)
+        for i in range(slits.nslits):
+            indx = (spat[None,:] > left[:,i,None] - _pad[0]) \
+                        & (spat[None,:] < right[:,i,None] + _pad[1]) \
+                        & (spec > slits.specmin[i])[:,None] & (spec < slits.specmax[i])[:,None]
+            ref[indx] = slits.spat_id[i]
+        assert np.array_equal(slits.slit_img(pad=pad), ref), 'Bad slit image'
+
+    # Slit IDs that do not fit in a 16-bit integer
+    spat_id = slits.spat_id.copy()
+    slits.spat_id = np.array([-3, np.iinfo(int).min, 40000])
+    img = slits.slit_img()
+    for i in range(slits.nslits):
+        assert np.any(img == slits.spat_id[i]), 'Slit ID not preserved'
+    slits.spat_id = spat_id
+
+    # Changing the edges changes the image
+    slits.init_tweaked()
+    slits.right_tweak[:,0] -= 5
+    assert not np.array_equal(slits.slit_img(), slits.slit_img(initial=True)), \
+            'Tweaked edges ignored'
+
+
+def test_spatial_coordinate_image():
+    nspec, nspat = 100, 50
+    spec = np.arange(nspec)
+    left = np.column_stack([2.3 + 0.05*spec, 15.5 + 0.05*spec, 30.0 - 0.02*spec])
+    right = left + np.array([12.2, 11.0, 15.7])
+    slits = SlitTraceSet(left, right, 'MultiSlit', nspat=nspat, PYP_SPEC='dummy')
+
+    # Brute-force construction
+    left, right, _ = slits.select_edges()
+    slitid_img = slits.slit_img()
+    spat = np.arange(nspat)
+    ref = np.zeros((nspec, nspat), dtype=float)
+    for i in range(slits.nslits):
+        coo = (spat[None,:] - left[:,i,None])/(right[:,i,None] - left[:,i,None])
+        indx = slitid_img == slits.spat_id[i]
+        ref[indx] = coo[indx]
+    assert np.allclose(slits.spatial_coordinate_image(), ref), 'Bad coordinate image'
+
+    # Only the selected slit is included
+    coo_img = slits.spatial_coordinate_image(slitidx=1)
+    indx = slits.slit_img(slitidx=1) == slits.spat_id[1]
+    coo = (spat[None,:] - left[:,1,None])/(right[:,1,None] - left[:,1,None])
+    assert np.allclose(coo_img[indx], coo[indx]), 'Bad coordinates for one slit'
+    assert np.all(coo_img[np.invert(indx)] == 0), 'Other slits included'
+
+    # Negative slit IDs, including the one for a slit with a NaN center
+    indx_img = slits.slit_img(use_spatial=False)
+    for spat_id in [[-3, np.iinfo(int).min, -7], [-3, 20, np.iinfo(int).min]]:
+        slits.spat_id = np.array(spat_id)
+        slitid_img = np.where(indx_img >= 0, slits.spat_id[indx_img], -1)
+        ref = np.zeros((nspec, nspat), dtype=float)
+        for i in range(slits.nslits):
+            coo = (spat[None,:] - left[:,i,None])/(right[:,i,None] - left[:,i,None])
+            indx = indx_img == i
+            ref[indx] = coo[indx]
+        assert np.allclose(slits.spatial_coordinate_image(slitid_img=slitid_img), ref), \
+                'Bad coordinate image for negative slit IDs'